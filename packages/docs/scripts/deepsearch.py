@@ -1,23 +1,26 @@
-import os
-import json
-import time
+import logging
 import requests
 import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # OpenRouter API configuration
 OPENAI_API_KEY = ""  # Replace with your actual API key
 BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
 MODEL = "perplexity/sonar-reasoning-pro:online"  # Using the online variant for web search
+MAX_WORKERS = 4  # Concurrent partner researches; keep modest to stay under rate limits
 
-# Headers for API requests
-headers = {
+logger = logging.getLogger(__name__)
+
+# Shared session so every research call reuses pooled keep-alive connections
+session = requests.Session()
+session.headers.update({
     "Authorization": f"Bearer {OPENAI_API_KEY}",
     "Content-Type": "application/json",
     "HTTP-Referer": "https://github.com/elizaos/knowledge",  # Replace with your actual repo
     "X-Title": "ElizaOS Partner Research"
-}
+})
 
 def extract_frontmatter(content):
     """Extract front matter from markdown content."""
@@ -34,11 +37,11 @@ def extract_frontmatter(content):
                 front_matter_dict = yaml.safe_load(parts[1])
                 if not isinstance(front_matter_dict, dict):
                      # Handle cases where frontmatter is not a proper dictionary (e.g., just a string)
-                     print(f"Warning: Frontmatter parsed, but is not a dictionary: {type(front_matter_dict)}")
+                     logger.warning("Frontmatter parsed, but is not a dictionary: %s", type(front_matter_dict))
                      front_matter_dict = {} # Reset to empty dict
                 main_content = parts[2].strip()
-            except Exception as e:
-                print(f"Error parsing front matter YAML: {e}. Keeping raw block.")
+            except yaml.YAMLError as e:
+                logger.error("Error parsing front matter YAML: %s. Keeping raw block.", e)
                 # If parsing fails, keep the raw block but reset dict and use content after second ---
                 front_matter_dict = {}
                 main_content = parts[2].strip()
@@ -64,26 +67,16 @@ def read_partner_info(partner_path):
             }
     return {"raw_front_matter": "", "front_matter_dict": {}, "content": "", "full_content": ""}
 
-def research_partner(partner_name, partner_info):
-    """Use SonarReasoningPro to research the partner and generate detailed information."""
-    front_matter = partner_info.get("front_matter_dict", {})
-    content = partner_info.get("content", "")
-    
-    # Create context from existing information
-    description = front_matter.get('description', '')
-    website = front_matter.get('website', '')
-    twitter = front_matter.get('twitter', '')
-    tags = ', '.join(front_matter.get('tags', []))
-    
-    # Plugin search context - relying on model's web search capability
-    plugin_context = f"""
+# Plugin search context - relying on model's web search capability
+PLUGIN_CONTEXT_TEMPLATE = """
     When researching the integration, please also investigate if there might be an official ElizaOS plugin for {partner_name}.
     Consider looking for resources associated with ElizaOS plugins, such as repositories within the elizaos-plugins organization on GitHub.
 
     If you find relevant plugin information (like its purpose from a README or description), please summarize it in the 'Integration with Eliza' section.
     """
 
-    prompt = f"""
+# Static research prompt scaffold, built once at import and filled in per partner
+RESEARCH_PROMPT_TEMPLATE = """
 I need comprehensive, factual information about {partner_name}, who is a partner of ElizaOS.
 Here's what I currently have about them:
 
@@ -92,7 +85,7 @@ Website: {website}
 Twitter: {twitter}
 Tags: {tags}
 
-Original content: 
+Original content:
 {content}
 
 {plugin_context}
@@ -112,7 +105,7 @@ Please research this company/project and provide detailed, factual information f
 3. ## Key Features
    - 5-7 specific, enhanced bullet points about their key features and advantages
    - Technical capabilities and differentiators
-   
+
 4. ## Integration with Eliza
    - Specific details on how their technology integrates with elizaOS
    - Technical synergies and use cases for the partnership
@@ -121,7 +114,7 @@ Please research this company/project and provide detailed, factual information f
 5. ## Recent Developments
    - Latest news, updates, or milestones (within the last year)
    - Roadmap items or future plans that have been publicly announced
-   
+
 6. ## Market Position
    - Their position compared to competitors
    - Key partnerships besides ElizaOS
@@ -130,11 +123,26 @@ Please research this company/project and provide detailed, factual information f
 7. ## Links
    - Website, documentation, GitHub, social media, etc.
 
-Important: Please DO NOT include citation markers like [1] or [2][3] in your response. 
+Important: Please DO NOT include citation markers like [1] or [2][3] in your response.
 Instead, integrate the information naturally without citation numbers.
 Focus on factual information from reputable sources. Include specific technical details where available.
 """
 
+def research_partner(partner_name, partner_info):
+    """Use SonarReasoningPro to research the partner and generate detailed information."""
+    front_matter = partner_info.get("front_matter_dict", {})
+    content = partner_info.get("content", "")
+
+    prompt = RESEARCH_PROMPT_TEMPLATE.format(
+        partner_name=partner_name,
+        description=front_matter.get('description', ''),
+        website=front_matter.get('website', ''),
+        twitter=front_matter.get('twitter', ''),
+        tags=', '.join(front_matter.get('tags', [])),
+        content=content,
+        plugin_context=PLUGIN_CONTEXT_TEMPLATE.format(partner_name=partner_name),
+    )
+
     # API request payload
     payload = {
         "model": MODEL,
@@ -145,49 +153,62 @@ Focus on factual information from reputable sources. Include specific technical
     }
 
     try:
-        response = requests.post(BASE_URL, headers=headers, json=payload)
+        response = session.post(BASE_URL, json=payload)
         response.raise_for_status()
         result = response.json()
         
         # Extract the research content from the response
         if 'choices' in result and len(result['choices']) > 0:
-            report = result['choices'][0]['message']['content']
-            return report
-        else:
-            return f"Error: No content returned for {partner_name}"
-            
-    except Exception as e:
-        return f"Error researching {partner_name}: {str(e)}"
+            return result['choices'][0]['message']['content']
+
+        logger.error("No content returned for %s", partner_name)
+        return None
+
+    except (requests.RequestException, ValueError) as e:
+        logger.error("Error researching %s: %s", partner_name, e)
+        return None
+
+# Patterns reused for every partner, compiled once at import
+CITATION_RE = re.compile(r'\[\d+\](?:\[\d+\])*')
+MULTI_SPACE_RE = re.compile(r'  +')
+TITLE_RE = re.compile(r'^# (.+?)(?=\n|$)', re.MULTILINE)
+LOGO_RE = re.compile(r'<div className="partner-logo">.*?</div>', re.DOTALL)
+BULLET_LINE_RE = re.compile(r'^\s*[-*]', re.MULTILINE)
+
+# Compiled section patterns, cached per heading so each is built only once
+_section_patterns = {}
+
+def extract_section(research_results, heading_pattern):
+    """Extract the body of a '## <heading>' section from the research results."""
+    pattern = _section_patterns.get(heading_pattern)
+    if pattern is None:
+        pattern = re.compile(rf'## {heading_pattern}(.*?)(?=\n##|$)', re.DOTALL)
+        _section_patterns[heading_pattern] = pattern
+    match = pattern.search(research_results)
+    return match.group(1).strip() if match else ""
+
+def clean_citations(text):
+    """Strip any citation markers that slipped past the prompt instructions."""
+    cleaned_text = CITATION_RE.sub('', text)
+    cleaned_text = MULTI_SPACE_RE.sub(' ', cleaned_text)
+    return cleaned_text
 
 def create_brief_markdown(partner_info, research_results):
     """Create a brief markdown file with just the most important sections."""
     # Use the parsed dict to get specific values
     front_matter_dict = partner_info.get("front_matter_dict", {})
-    
+
     # Extract the title from frontmatter or content
     title_text = front_matter_dict.get('title', '')
     title_heading = f"# {title_text}" if title_text else ""
-    
-    # Extract sections from research results using regex
-    about_match = re.search(r'## About [^\n]+\n(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    about = about_match.group(1).strip() if about_match else ""
-    
-    integration_match = re.search(r'## Integration with Eliza\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    integration = integration_match.group(1).strip() if integration_match else ""
-    
-    recent_match = re.search(r'## Recent Developments\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    recent = recent_match.group(1).strip() if recent_match else ""
-    
-    market_match = re.search(r'## Market Position\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    market = market_match.group(1).strip() if market_match else ""
+
+    # Extract sections from research results
+    about = extract_section(research_results, r'About [^\n]+\n')
+    integration = extract_section(research_results, r'Integration with Eliza\s*')
+    recent = extract_section(research_results, r'Recent Developments\s*')
+    market = extract_section(research_results, r'Market Position\s*')
     
     # Clean any citation markers that might have been missed in the instruction
-    def clean_citations(text):
-        pattern = r'\[\d+\](?:\[\d+\])*'
-        cleaned_text = re.sub(pattern, '', text)
-        cleaned_text = re.sub(r'  +', ' ', cleaned_text)
-        return cleaned_text
-    
     about = clean_citations(about)
     integration = clean_citations(integration)
     recent = clean_citations(recent)
@@ -233,11 +254,11 @@ def create_enhanced_markdown(partner_info, research_results):
     
     # Extract the title and logo section from the original content (after frontmatter)
     # Use the title from the parsed frontmatter as a fallback
-    title_match = re.search(r'^# (.+?)(?=\n|$)', original_content, re.MULTILINE)
+    title_match = TITLE_RE.search(original_content)
     title_text = title_match.group(1) if title_match else front_matter_dict.get('title', '')
     title_heading = f"# {title_text}" if title_text else ""
         
-    logo_match = re.search(r'<div className="partner-logo">.*?</div>', original_content, re.DOTALL)
+    logo_match = LOGO_RE.search(original_content)
     logo = logo_match.group(0) if logo_match else ""
     
     # Extract the short description (single line after the logo, or from frontmatter)
@@ -249,27 +270,14 @@ def create_enhanced_markdown(partner_info, research_results):
     if not short_desc: # Fallback to frontmatter description
         short_desc = front_matter_dict.get('description', '')
     
-    # Extract sections from research results using regex
-    about_match = re.search(r'## About [^\n]+\n(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    about = about_match.group(1).strip() if about_match else ""
-    
-    tech_match = re.search(r'## Technology\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    tech = tech_match.group(1).strip() if tech_match else ""
-    
-    features_match = re.search(r'## Key Features\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    features = features_match.group(1).strip() if features_match else ""
-    
-    integration_match = re.search(r'## Integration with Eliza\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    integration = integration_match.group(1).strip() if integration_match else ""
-    
-    recent_match = re.search(r'## Recent Developments\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    recent = recent_match.group(1).strip() if recent_match else ""
-    
-    market_match = re.search(r'## Market Position\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    market = market_match.group(1).strip() if market_match else ""
-    
-    links_match = re.search(r'## Links\s*(.*?)(?=\n##|$)', research_results, re.DOTALL)
-    links = links_match.group(1).strip() if links_match else ""
+    # Extract sections from research results
+    about = extract_section(research_results, r'About [^\n]+\n')
+    tech = extract_section(research_results, r'Technology\s*')
+    features = extract_section(research_results, r'Key Features\s*')
+    integration = extract_section(research_results, r'Integration with Eliza\s*')
+    recent = extract_section(research_results, r'Recent Developments\s*')
+    market = extract_section(research_results, r'Market Position\s*')
+    links = extract_section(research_results, r'Links\s*')
     
     # Convert lists to bullet points if they aren't already
     def ensure_bullet_points(text):
@@ -294,7 +302,7 @@ def create_enhanced_markdown(partner_info, research_results):
         return '\n'.join(result)
     
     # Ensure features are formatted as bullet points
-    if features and not re.search(r'^\s*[-*]', features, re.MULTILINE):
+    if features and not BULLET_LINE_RE.search(features):
         features = ensure_bullet_points(features)
     
     # Build the enhanced markdown using the raw frontmatter block
@@ -344,60 +352,90 @@ def save_enhanced_markdown(partner_path, enhanced_markdown):
         f.write(enhanced_markdown)
     return output_path
 
+def process_partner(partner_folder):
+    """Research a single partner folder and write its markdown files."""
+    partner_name = partner_folder.name.replace('-', ' ').title()
+
+    # Skip partners whose generated files are already newer than their index.md,
+    # so re-runs only pay for partners that actually changed
+    index_path = partner_folder / "index.md"
+    enhanced_path = partner_folder / "index2.md"
+    brief_path = partner_folder / "brief.md"
+    if (enhanced_path.exists() and brief_path.exists()
+            and enhanced_path.stat().st_mtime > index_path.stat().st_mtime):
+        logger.info("Skipping %s (already researched)", partner_name)
+        return {
+            "partner": partner_name,
+            "output_file": str(enhanced_path),
+            "brief_file": str(brief_path),
+            "status": "Cached"
+        }
+
+    logger.info("Processing %s...", partner_name)
+
+    # Read existing partner info
+    partner_info = read_partner_info(partner_folder)
+
+    # Research the partner; leave existing files untouched if the research failed
+    research_results = research_partner(partner_name, partner_info)
+    if research_results is None:
+        return {
+            "partner": partner_name,
+            "output_file": "",
+            "brief_file": "",
+            "status": "Error"
+        }
+
+    # Create enhanced markdown
+    enhanced_markdown = create_enhanced_markdown(partner_info, research_results)
+
+    # Create brief markdown
+    brief_markdown = create_brief_markdown(partner_info, research_results)
+
+    # Save the enhanced markdown
+    output_path = save_enhanced_markdown(partner_folder, enhanced_markdown)
+
+    # Save the brief markdown
+    brief_path = save_brief_markdown(partner_folder, brief_markdown)
+
+    return {
+        "partner": partner_name,
+        "output_file": str(output_path),
+        "brief_file": str(brief_path),
+        "status": "Success" if len(enhanced_markdown) > 100 else "Possible Error"
+    }
+
 def process_partners(root_dir):
     """Process all partner folders and generate enhanced markdown files."""
     root_path = Path(root_dir)
-    
+
     # Get all directories that might be partner folders
-    partner_folders = [d for d in root_path.iterdir() 
+    partner_folders = [d for d in root_path.iterdir()
                       if d.is_dir() and (d / "index.md").exists()]
-    
+
     results = []
-    
-    for partner_folder in partner_folders:
-        partner_name = partner_folder.name.replace('-', ' ').title()
-        print(f"Processing {partner_name}...")
-        
-        # Read existing partner info
-        partner_info = read_partner_info(partner_folder)
-        
-        # Research the partner
-        research_results = research_partner(partner_name, partner_info)
-        
-        # Create enhanced markdown
-        enhanced_markdown = create_enhanced_markdown(partner_info, research_results)
-        
-        # Create brief markdown
-        brief_markdown = create_brief_markdown(partner_info, research_results)
-        
-        # Save the enhanced markdown
-        output_path = save_enhanced_markdown(partner_folder, enhanced_markdown)
-        
-        # Save the brief markdown
-        brief_path = save_brief_markdown(partner_folder, brief_markdown)
-        
-        results.append({
-            "partner": partner_name,
-            "output_file": str(output_path),
-            "brief_file": str(brief_path),
-            "status": "Success" if len(enhanced_markdown) > 100 else "Possible Error"
-        })
-        
-        # Add a delay to avoid rate limiting
-        time.sleep(5)
-    
+
+    # The work is dominated by waiting on the research API, so run a few
+    # partners concurrently instead of strictly one at a time
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(process_partner, folder) for folder in partner_folders]
+        for future in as_completed(futures):
+            results.append(future.result())
+
     return results
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # The root directory of your partner folders
     ROOT_DIR = "."  # Change if your script is in a different location
-    
-    print("Starting ElizaOS Partner Enhancement...")
+
+    logger.info("Starting ElizaOS Partner Enhancement...")
     results = process_partners(ROOT_DIR)
-    
+
     # Output summary
-    print("\nEnhancement Complete!")
-    print(f"Processed {len(results)} partners:")
-    
+    logger.info("\nEnhancement Complete!")
+    logger.info("Processed %d partners:", len(results))
+
     for result in results:
-        print(f"- {result['partner']}: {result['status']} -> {result['output_file']}")
+        logger.info("- %s: %s -> %s", result['partner'], result['status'], result['output_file'])
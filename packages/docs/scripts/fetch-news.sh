@@ -4,7 +4,9 @@
 SOURCE_URL="https://m3-org.github.io/ai-news/elizaos/md"
 OUTPUT_DIR="news"
 
+# Download the days in parallel; -nc still skips files we already have
 for i in {0..9}; do
     DATE=$(date -d "-$i days" '+%Y-%m-%d')
-    wget -nc "$SOURCE_URL/$DATE.md" -P "$OUTPUT_DIR"
+    wget -nc "$SOURCE_URL/$DATE.md" -P "$OUTPUT_DIR" &
 done
+wait
@@ -17,43 +17,78 @@ from datetime import datetime
 from pathlib import Path
 import argparse
 
+# Common section headers demoted to H4, compiled once at import instead of per release
+SECTION_HEADER_PATTERNS = [
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r'^## (What\'s Changed.*?)$',
+        r'^## (Features.*?)$',
+        r'^## (Fixes.*?)$',
+        r'^## (Chores.*?)$',
+        r'^## (Documentation.*?)$',
+        r'^## (Tests.*?)$',
+        r'^## (Other.*?)$',
+        r'^## (Major changes.*?)$',
+        r'^## (New Features.*?)$',
+        r'^## (New Fixes.*?)$',
+        r'^## (New Contributors.*?)$',
+    )
+]
+
+# Remaining per-release cleanup patterns, also compiled once at import
+HTML_TAG_RE = re.compile(r'<[^>]*>')
+TEMPLATE_VAR_RE = re.compile(r'{{[^}]*}}')
+ANY_HEADER_RE = re.compile(r'^#{1,3} ([^#].*)$', re.MULTILINE)
+H4_HEADER_RE = re.compile(r'^(#### .+)$', re.MULTILINE)
+EMPTY_H2_RE = re.compile(r'\n##\s*\n')
+BULLET_RE = re.compile(r'^\s*\*\s+', re.MULTILINE)
+LINK_RE = re.compile(r'\[([^\]]+)\]\((https://[^\)]+)\)')
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+H4_SPACING_RE = re.compile(r'^(#### .+)\n(?!\n)', re.MULTILINE)
+
 def fetch_releases(repo, token=None, since_version=None):
     """
-    Fetch releases from GitHub API
-    If since_version is provided, only returns releases newer than that version
+    Fetch releases from GitHub API, yielding them as they arrive
+    If since_version is provided, only yields releases newer than that version
     """
-    headers = {}
+    # One session for all pages, so every request reuses the same connection
+    session = requests.Session()
     if token:
-        headers["Authorization"] = f"token {token}"
-    
-    url = f"https://api.github.com/repos/{repo}/releases"
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        print(f"Error fetching releases: {response.status_code}")
-        print(response.text)
-        sys.exit(1)
-    
-    releases = response.json()
-    
-    # If since_version is provided, filter out older releases
+        session.headers["Authorization"] = f"token {token}"
+
+    # Clean version string for comparison
     if since_version:
-        # Clean version string for comparison
         since_version = since_version.lstrip('v')
-        filtered_releases = []
-        
-        for release in releases:
+
+    url = f"https://api.github.com/repos/{repo}/releases"
+    page = 1
+
+    # Fetch releases page by page so we only hold (and transfer) what we need,
+    # stopping as soon as we reach the version already in the changelog
+    while True:
+        response = session.get(url, params={"per_page": 100, "page": page})
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            print(f"Error fetching releases: {response.status_code}")
+            print(response.text)
+            sys.exit(1)
+
+        batch = response.json()
+        if not batch:
+            return
+
+        for release in batch:
             tag_name = release.get("tag_name", "").lstrip('v')
-            
+
             # If we can't determine the ordering or we hit our since_version, stop
-            if not tag_name or tag_name == since_version:
-                break
-                
-            filtered_releases.append(release)
-            
-        return filtered_releases
-    
-    return releases
+            if since_version and (not tag_name or tag_name == since_version):
+                return
+
+            yield release
+
+        page += 1
 
 def extract_latest_version(changelog_content):
     """Extract the most recent version from the existing changelog"""
@@ -71,7 +106,7 @@ def process_release(release):
     
     if published_date:
         try:
-            date_obj = datetime.strptime(published_date, "%Y-%m-%dT%H:%M:%SZ")
+            date_obj = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
             date_str = date_obj.strftime("%B %d, %Y")
             content += f"## {name} ({date_str})\n\n"
         except ValueError:
@@ -91,10 +126,10 @@ def process_release(release):
 def process_content_block(content):
     """Process and format a block of changelog content"""
     # First, let's make sure we have a clean slate by removing any existing HTML tags
-    content = re.sub(r'<[^>]*>', '', content)
+    content = HTML_TAG_RE.sub('', content)
     
     # Remove template variables like {{maxTweetLength}}
-    content = re.sub(r'{{[^}]*}}', '', content)
+    content = TEMPLATE_VAR_RE.sub('', content)
     
     # Replace specific problematic strings - handle the maxTweetLength issue
     content = content.replace('- {{maxTweetLength}} doesn\'t work in tweet post template', '- maxTweetLength doesn\'t work in tweet post template')
@@ -107,39 +142,19 @@ def process_content_block(content):
         return f"#### {match.group(1)}"
         
     # Process common section headers
-    section_headers = [
-        r'^## (What\'s Changed.*?)$',
-        r'^## (Features.*?)$', 
-        r'^## (Fixes.*?)$',
-        r'^## (Chores.*?)$',
-        r'^## (Documentation.*?)$',
-        r'^## (Tests.*?)$',
-        r'^## (Other.*?)$',
-        r'^## (Major changes.*?)$',
-        r'^## (New Features.*?)$',
-        r'^## (New Fixes.*?)$'
-        r'^## (New Contributors.*?)$'
-    ]
+    for pattern in SECTION_HEADER_PATTERNS:
+        content = pattern.sub(header_replacement, content)
     
-    for pattern in section_headers:
-        content = re.sub(pattern, header_replacement, content, flags=re.MULTILINE)
-    
-    # Convert any remaining ## headers to #### (that aren't what we've already matched)
-    content = re.sub(r'^## ([^#].*)$', header_replacement, content, flags=re.MULTILINE)
-    
-    # Convert any ### headers to #### as well
-    content = re.sub(r'^### ([^#].*)$', header_replacement, content, flags=re.MULTILINE)
-    
-    # Convert any level 1 headers to level 4
-    content = re.sub(r'^# ([^#].*)$', header_replacement, content, flags=re.MULTILINE)
+    # Convert any remaining level 1-3 headers to #### in a single pass
+    content = ANY_HEADER_RE.sub(header_replacement, content)
     
     # Add spacing after section headers (#### headers)
-    content = re.sub(r'^(#### .+)$', r'\1\n', content, flags=re.MULTILINE)
+    content = H4_HEADER_RE.sub(r'\1\n', content)
     
     # Process "New Contributors" sections
     if "## New Contributors" in content:
         # First remove any empty ## headers that might be present
-        content = re.sub(r'\n##\s*\n', '\n', content)
+        content = EMPTY_H2_RE.sub('\n', content)
         
         # Split the content at the New Contributors section
         parts = content.split("## New Contributors", 1)
@@ -166,16 +181,16 @@ def process_content_block(content):
         content = main_content + contributors_formatted
     
     # Ensure bullet points are properly formatted
-    content = re.sub(r'^\s*\*\s+', '* ', content, flags=re.MULTILINE)
+    content = BULLET_RE.sub('* ', content)
     
     # Ensure links are properly formatted
-    content = re.sub(r'\[([^\]]+)\]\((https://[^\)]+)\)', r'[\1](\2)', content)
+    content = LINK_RE.sub(r'[\1](\2)', content)
     
     # Clean up excessive newlines
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    content = EXTRA_NEWLINES_RE.sub('\n\n', content)
     
     # Fix header spacing
-    content = re.sub(r'^(#### .+)\n(?!\n)', r'\1\n\n', content, flags=re.MULTILINE)
+    content = H4_SPACING_RE.sub(r'\1\n\n', content)
     
     # One more pass to fix any remaining "$1" issues that might have escaped our regex replacements
     content = content.replace("#### $1", "#### Changes")
@@ -212,15 +227,21 @@ def main():
     
     if args.force_rebuild or not existing_content:
         print("Fetching all releases...")
-        releases = fetch_releases(args.repo, token)
-        
-        # Generate a full changelog
-        content = "# Changelog\n\n"
-        for release in releases:
-            content += process_release(release)
+
+        # Stream each release to a temp file instead of accumulating the whole
+        # changelog, then swap it in so a failed fetch can't truncate the old file
+        tmp_output = f"{args.output}.tmp"
+        with open(tmp_output, 'w', encoding='utf-8') as f:
+            f.write("# Changelog\n\n")
+            for release in fetch_releases(args.repo, token):
+                f.write(process_release(release))
+        os.replace(tmp_output, args.output)
+
+        print(f"Complete changelog rebuilt and saved to {args.output}")
+        return
     else:
         print(f"Fetching releases newer than {latest_version}...")
-        new_releases = fetch_releases(args.repo, token, latest_version)
+        new_releases = list(fetch_releases(args.repo, token, latest_version))
         
         if not new_releases:
             print("No new releases found. Changelog is already up to date.")
@@ -229,9 +250,7 @@ def main():
         print(f"Found {len(new_releases)} new releases to add")
         
         # Generate content for new releases
-        new_content = ""
-        for release in new_releases:
-            new_content += process_release(release)
+        new_content = "".join(process_release(release) for release in new_releases)
         
         # If existing content doesn't start with the Changelog title, we'll add it
         if not existing_content.startswith("# Changelog"):
@@ -249,11 +268,8 @@ def main():
     # Write the updated content to the output file
     with open(args.output, 'w', encoding='utf-8') as f:
         f.write(content)
-    
-    if args.force_rebuild or not existing_content:
-        print(f"Complete changelog rebuilt and saved to {args.output}")
-    else:
-        print(f"Changelog updated with {len(new_releases)} new releases and saved to {args.output}")
+
+    print(f"Changelog updated with {len(new_releases)} new releases and saved to {args.output}")
 
 if __name__ == "__main__":
     main()
@@ -32,25 +32,21 @@ function generateMarkdown(partner) {
   // Use the existing preview path from the partner data
   const imagePath = partner.preview;
 
-  // Create links section
-  let linksSection = '## Links\n\n';
-
-  // Add website and source links
-  linksSection += `- [Website](${partner.website})\n`;
-  linksSection += `- [Source](${partner.source})\n`;
-
-  // Add social links if they exist
-  if (partner.twitter) {
-    linksSection += `- [Twitter](${partner.twitter})\n`;
-  }
-
-  if (partner.discord) {
-    linksSection += `- [Discord](${partner.discord})\n`;
-  }
-
-  if (partner.telegram) {
-    linksSection += `- [Telegram](${partner.telegram})\n`;
-  }
+  // Create links section: website and source always, social links when present
+  const links = [
+    ['Website', partner.website],
+    ['Source', partner.source],
+    ['Twitter', partner.twitter],
+    ['Discord', partner.discord],
+    ['Telegram', partner.telegram],
+  ];
+
+  const linksSection =
+    '## Links\n\n' +
+    links
+      .filter(([, url]) => url)
+      .map(([label, url]) => `- [${label}](${url})\n`)
+      .join('');
 
   return `---
 id: ${partner.slug}
@@ -128,5 +124,7 @@ function main() {
   }
 }
 
-// Run the script
-main();
+// Run the script only when executed directly, not when required by another script
+if (require.main === module) {
+  main();
+}
@@ -10,6 +10,7 @@ const REGISTRY_URL = `https://raw.githubusercontent.com/${REGISTRY_ORG}/${REGIST
 const OUTPUT_FILE = path.join(__dirname, '../src/data/registry-users.tsx');
 const DESCRIPTIONS_FILE = path.join(__dirname, '../src/data/plugin-descriptions.json');
 const GITHUB_TOKEN = process.env.GITHUB_TOKEN; // Optional GitHub token for higher rate limits
+const CONCURRENT_FETCHES = 5; // How many GitHub description requests to run at once
 
 /**
  * Get GitHub preview URL for repository
@@ -56,12 +57,10 @@ function fetchGithubDescription(repoPath) {
 }
 
 /**
- * Transform a registry entry to extract plugin information
+ * Derive a human-readable display name from a plugin package name
  */
-function processRegistryEntry(name, repoUrl) {
-  const repoPath = repoUrl.replace('github:', '');
-
-  const displayName = name
+function getDisplayName(name) {
+  return name
     .replace('@elizaos-plugins/plugin-', '')
     .replace('@elizaos-plugins/client-', '')
     .replace('@elizaos-plugins/adapter-', '')
@@ -69,12 +68,22 @@ function processRegistryEntry(name, repoUrl) {
     .split(' ')
     .map((word) => word.charAt(0).toUpperCase() + word.slice(1))
     .join(' ');
+}
 
-  const type = name.includes('client-')
-    ? 'client'
-    : name.includes('adapter-')
-      ? 'adapter'
-      : 'plugin';
+/**
+ * Classify a plugin package name as client, adapter or plugin
+ */
+function getPluginType(name) {
+  return name.includes('client-') ? 'client' : name.includes('adapter-') ? 'adapter' : 'plugin';
+}
+
+/**
+ * Transform a registry entry to extract plugin information
+ */
+function processRegistryEntry(name, repoUrl) {
+  const repoPath = repoUrl.replace('github:', '');
+  const displayName = getDisplayName(name);
+  const type = getPluginType(name);
 
   return {
     id: name,
@@ -163,28 +172,31 @@ async function updateDescriptions(plugins, customData) {
     }
   }
 
-  for (const plugin of plugins) {
-    // Skip if we already have a custom description
-    if (updatedDescriptions[plugin.id]?.description) {
-      continue;
-    }
+  // Skip plugins that already have a custom description
+  const pluginsToFetch = plugins.filter((plugin) => !updatedDescriptions[plugin.id]?.description);
 
-    try {
-      const githubDescription = await fetchGithubDescription(plugin.repo_path);
-      if (githubDescription) {
-        updatedDescriptions[plugin.id] = {
-          ...updatedDescriptions[plugin.id],
-          description: githubDescription,
-        };
-        updated = true;
-        console.log(`Updated description for ${plugin.id}`);
-      }
-    } catch (error) {
-      console.warn(`Failed to fetch description for ${plugin.id}:`, error);
-    }
+  // Fetch descriptions in small concurrent batches; the batch size bounds the request rate
+  for (let i = 0; i < pluginsToFetch.length; i += CONCURRENT_FETCHES) {
+    const batch = pluginsToFetch.slice(i, i + CONCURRENT_FETCHES);
+    const results = await Promise.allSettled(
+      batch.map((plugin) => fetchGithubDescription(plugin.repo_path))
+    );
 
-    // Add a small delay to avoid rate limiting
-    await new Promise((resolve) => setTimeout(resolve, 100));
+    results.forEach((result, index) => {
+      const plugin = batch[index];
+      if (result.status === 'fulfilled') {
+        if (result.value) {
+          updatedDescriptions[plugin.id] = {
+            ...updatedDescriptions[plugin.id],
+            description: result.value,
+          };
+          updated = true;
+          console.log(`Updated description for ${plugin.id}`);
+        }
+      } else {
+        console.warn(`Failed to fetch description for ${plugin.id}:`, result.reason);
+      }
+    });
   }
 
   if (updated) {
@@ -200,35 +212,25 @@ async function updateDescriptions(plugins, customData) {
  */
 function generateUsersFile(plugins, customData) {
   // Extract names of plugins from GitHub
-  const registryPluginNames = plugins.map((plugin) => plugin.id);
+  const registryPluginNames = new Set(plugins.map((plugin) => plugin.id));
 
   // Find plugins in descriptions that aren't in the registry
   const missingPlugins = [];
   for (const pluginId in customData) {
-    if (!registryPluginNames.includes(pluginId)) {
+    if (!registryPluginNames.has(pluginId)) {
       // Create plugin data for missing plugins
-      const displayName = pluginId
-        .replace('@elizaos-plugins/plugin-', '')
-        .replace('@elizaos-plugins/client-', '')
-        .replace('@elizaos-plugins/adapter-', '')
-        .replace(/-/g, ' ')
-        .split(' ')
-        .map((word) => word.charAt(0).toUpperCase() + word.slice(1))
-        .join(' ');
-
-      const type = pluginId.includes('client-')
-        ? 'client'
-        : pluginId.includes('adapter-')
-          ? 'adapter'
-          : 'plugin';
+      const displayName = getDisplayName(pluginId);
+      const type = getPluginType(pluginId);
+
+      // For missing plugins, we'll use the elizaos-plugins org as fallback
+      const repoName = pluginId.split('/').pop();
 
       // Create the missing plugin entry
       missingPlugins.push({
         id: pluginId,
         name: pluginId,
-        // For missing plugins, we'll use the elizaos-plugins org as fallback
-        repo_url: `github:elizaos-plugins/${pluginId.split('/').pop()}`,
-        repo_path: `elizaos-plugins/${pluginId.split('/').pop()}`,
+        repo_url: `github:elizaos-plugins/${repoName}`,
+        repo_path: `elizaos-plugins/${repoName}`,
         display_name: displayName,
         type: type,
       });
@@ -311,4 +313,7 @@ async function main() {
   }
 }
 
-main();
+// Run only when executed directly, not when required by another script
+if (require.main === module) {
+  main();
+}
@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Initialize git submodules
-git submodule update --init --recursive
+# Initialize git submodules, fetching only the pinned commits instead of full histories
+git submodule update --init --recursive --depth 1
 
 # Check if initialization was successful
 if [ $? -eq 0 ]; then
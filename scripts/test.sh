@@ -30,15 +30,17 @@ if [ ! -z "$1" ]; then
     fi
 
     echo -e "\033[1mTesting package: $package\033[0m"
-    # Use find to get all test files and pass them explicitly to vitest
-    test_files=$(find "packages/$package/src" -name "*.test.ts" -type f)
-    if [ -z "$test_files" ]; then
+    # Glob all test files in the shell and pass them explicitly to vitest
+    shopt -s globstar nullglob
+    test_files=("packages/$package/src"/**/*.test.ts)
+    shopt -u globstar nullglob
+    if [ ${#test_files[@]} -eq 0 ]; then
         echo "No test files found"
         exit 1
     fi
     echo "Found test files:"
-    echo "$test_files"
-    node --experimental-vm-modules $(which vitest) $test_files
+    printf '%s\n' "${test_files[@]}"
+    node --experimental-vm-modules $(which vitest) "${test_files[@]}"
     exit $?
 fi
 
@@ -49,7 +51,9 @@ if [ ! -d "packages" ]; then
 fi
 
 # Find all packages under the packages directory
-PACKAGES=($(find packages -mindepth 1 -maxdepth 1 -type d -exec basename {} \;))
+PACKAGES=(packages/*/)
+PACKAGES=("${PACKAGES[@]%/}")
+PACKAGES=("${PACKAGES[@]#packages/}")
 
 # Test packages in specified order
 for package in "${PACKAGES[@]}"; do
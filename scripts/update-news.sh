@@ -30,7 +30,7 @@ done
 echo "Updating repomix config..."
 
 # Update repomix config with recent news files
-news_files=$(find "$OUTPUT_DIR" -name "*.md" -type f -mtime -${MAX_DAYS_TO_CHECK} | sort -r | jq -R . | jq -s .)
+news_files=$(find "$OUTPUT_DIR" -name "*.md" -type f -mtime -${MAX_DAYS_TO_CHECK} | sort -r | jq -Rn '[inputs]')
 
 # Use jq to update the config file
 jq --argjson news "$news_files" '